@@ -18,7 +18,9 @@ class BinaryRelevance(MultilabelModel):
 
     base_clf : :py:mod:`libact.models` object instances
         If wanting to use predict_proba, base_clf are required to support
-        predict_proba method.
+        predict_proba method. If the underlying scikit-learn estimator is
+        created with warm_start=True, retraining reuses the previously fitted
+        classifier of each label as initialization.
 
     n_jobs : int, optional, default: 1
         The number of jobs to use for the computation. If -1 all CPUs are
@@ -62,6 +64,12 @@ class BinaryRelevance(MultilabelModel):
         X = np.array(X)
         Y = np.array(Y)
 
+        prev_clfs = None
+        if self.warm_start and self.clfs_ is not None \
+                and self.n_labels_ == np.shape(Y)[1] \
+                and self.n_features_ == np.shape(X)[1]:
+            prev_clfs = self.clfs_
+
         self.n_labels_ = np.shape(Y)[1]
         self.n_features_ = np.shape(X)[1]
 
@@ -70,6 +78,9 @@ class BinaryRelevance(MultilabelModel):
             # TODO should we handle it here or we should handle it before calling
             if len(np.unique(Y[:, i])) == 1:
                 clf = DummyClf()
+            elif prev_clfs is not None \
+                    and not isinstance(prev_clfs[i], DummyClf):
+                clf = prev_clfs[i]
             else:
                 clf = copy.deepcopy(self.base_clf)
             self.clfs_.append(clf)
@@ -81,6 +92,14 @@ class BinaryRelevance(MultilabelModel):
 
         return self
 
+    @property
+    def warm_start(self):
+        """Whether retraining reuses the fitted classifier of each label, i.e.
+        whether the scikit-learn estimator of base_clf has warm_start=True."""
+        model = getattr(self.base_clf, 'model',
+                        getattr(self.base_clf, '_model', None))
+        return bool(getattr(model, 'warm_start', False))
+
     def predict(self, X):
         r"""Predict labels.
 
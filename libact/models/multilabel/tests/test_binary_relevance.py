@@ -13,7 +13,7 @@ import sklearn.linear_model
 
 from libact.base.dataset import Dataset
 from libact.models import LogisticRegression
-from libact.models.multilabel import BinaryRelevance
+from libact.models.multilabel import BinaryRelevance, DummyClf
 
 
 class BinaryRelevanceTestCase(unittest.TestCase):
@@ -71,6 +71,55 @@ class BinaryRelevanceTestCase(unittest.TestCase):
         assert_array_equal(br.predict(self.X_test).astype(int),
                            br_par.predict(self.X_test).astype(int))
 
+    def test_binary_relevance_warm_start(self):
+        br = BinaryRelevance(
+                base_clf=LogisticRegression(solver='lbfgs', warm_start=True))
+        self.assertTrue(br.warm_start)
+        br.train(Dataset(self.X_train[:30], self.Y_train[:30]))
+        prev_clfs = list(br.clfs_)
+        br.train(Dataset(self.X_train, self.Y_train))
+        for prev_clf, clf in zip(prev_clfs, br.clfs_):
+            if not isinstance(prev_clf, DummyClf) \
+                    and not isinstance(clf, DummyClf):
+                self.assertIs(clf, prev_clf)
+
+        br_cold = BinaryRelevance(base_clf=LogisticRegression(solver='lbfgs'))
+        self.assertFalse(br_cold.warm_start)
+        br_cold.train(Dataset(self.X_train[:30], self.Y_train[:30]))
+        prev_clfs = list(br_cold.clfs_)
+        br_cold.train(Dataset(self.X_train, self.Y_train))
+        for prev_clf, clf in zip(prev_clfs, br_cold.clfs_):
+            self.assertIsNot(clf, prev_clf)
+            self.assertIsNot(clf, br_cold.base_clf)
+
+        assert_array_equal(br.predict(self.X_test).astype(int),
+                           br_cold.predict(self.X_test).astype(int))
+
+        # fitted classifiers can't be reused when the feature count changes
+        prev_clfs = list(br.clfs_)
+        br.train(Dataset(self.X_train[:, :10], self.Y_train))
+        for prev_clf, clf in zip(prev_clfs, br.clfs_):
+            self.assertIsNot(clf, prev_clf)
+        br_cold.train(Dataset(self.X_train[:, :10], self.Y_train))
+        assert_array_equal(br.predict(self.X_test[:, :10]).astype(int),
+                           br_cold.predict(self.X_test[:, :10]).astype(int))
+
+    def test_binary_relevance_warm_start_dummy_label(self):
+        Y_const = np.copy(self.Y_train)
+        Y_const[:, 0] = 0
+        br = BinaryRelevance(
+                base_clf=LogisticRegression(solver='lbfgs', warm_start=True))
+        br_cold = BinaryRelevance(base_clf=LogisticRegression(solver='lbfgs'))
+
+        # label 0 goes from constant to non-constant and back
+        for Y in [Y_const, self.Y_train, Y_const]:
+            br.train(Dataset(self.X_train, Y))
+            br_cold.train(Dataset(self.X_train, Y))
+            self.assertEqual(isinstance(br.clfs_[0], DummyClf),
+                             bool(np.all(Y[:, 0] == 0)))
+            assert_array_equal(br.predict(self.X_test).astype(int),
+                               br_cold.predict(self.X_test).astype(int))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,23 +8,102 @@ from joblib import Parallel, delayed
 from libact.base.dataset import Dataset
 from libact.base.interfaces import QueryStrategy, ContinuousModel
 from libact.utils import inherit_docstring_from, seed_random_state, zip
-from libact.models.multilabel import BinaryRelevance
-
-
-def _calc_approx_err(br, dataset, X_pool):
+from libact.models import LogisticRegression
+from libact.models.multilabel import BinaryRelevance, DummyClf
+
+
+def _predict_real(br, X_pool):
+    """Return br.predict_real(X_pool). If every label is handled by a linear
+    LogisticRegression or a DummyClf, all labels are computed with one matrix
+    product instead of one decision_function call per label."""
+    coef, intercept = [], []
+    for clf in br.clfs_:
+        if isinstance(clf, DummyClf):
+            coef.append(np.zeros(br.n_features_))
+            intercept.append(2. * clf.cls - 1.)
+        elif isinstance(clf, LogisticRegression) \
+                and len(clf.model.classes_) == 2:
+            coef.append(clf.model.coef_[0])
+            intercept.append(clf.model.intercept_[0])
+        else:
+            return br.predict_real(X_pool)
+    return np.dot(X_pool, np.array(coef).T) + np.array(intercept)
+
+
+def _calc_approx_err(br, dataset, X_pool, bound=np.inf, batch_size=None):
+    """Retrain a copy of binary relevance br on dataset and return the
+    approximated generalization error on X_pool.
+
+    X_pool is scored batch_size rows at a time (a tenth of the pool by
+    default). Since the error of each sample is non-negative, scoring stops
+    as soon as the partial sum exceeds bound, and that partial sum is
+    returned. The model is always fully retrained; only the prediction cost
+    on X_pool is cut short."""
+    if batch_size is None:
+        batch_size = max(1, X_pool.shape[0] // 10)
+    if br.clfs_ is None:
+        # binary relevance copies base_clf for each label when training
+        br = BinaryRelevance(br.base_clf, n_jobs=1)
+    else:
+        br = copy.deepcopy(br)
+        br.n_jobs = 1
     br.train(dataset)
-    br_real = br.predict_real(X_pool)
-
-    pos = np.copy(br_real)
-    pos[br_real<0] = 1
-    pos = np.max((1.-pos), axis=1)
-
-    neg = np.copy(br_real)
-    neg[br_real>0] = -1
-    neg = np.max((1.+neg), axis=1)
+    err = 0.
+    for start in range(0, X_pool.shape[0], batch_size):
+        br_real = _predict_real(br, X_pool[start:start+batch_size])
+        err += np.sum(_approx_err(br_real))
+        if err > bound:
+            break
+    return err
+
+
+def _approx_err_numpy(br_real):
+    # hinge loss of the least confident positive and negative label, rows
+    # without any positive (negative) label contribute 0 for that part
+    pos = np.where(br_real >= 0, 1. - br_real, -np.inf).max(axis=1)
+    neg = np.where(br_real <= 0, 1. + br_real, -np.inf).max(axis=1)
+    return np.maximum(0., pos) + np.maximum(0., neg)
+
+
+def _approx_err_loop(br_real):
+    # same as _approx_err_numpy in a single pass over br_real, without the
+    # (n_samples, n_labels) temporaries; meant to be compiled with numba
+    n_samples, n_labels = br_real.shape
+    err = np.empty(n_samples)
+    for i in range(n_samples):
+        pos, neg = 0., 0.
+        for j in range(n_labels):
+            val = br_real[i, j]
+            if val >= 0 and 1. - val > pos:
+                pos = 1. - val
+            if val <= 0 and 1. + val > neg:
+                neg = 1. + val
+        err[i] = pos + neg
+    return err
+
+
+def _load_approx_err_numba():
+    """Return _approx_err_loop compiled with numba, or None if numba is not
+    installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    kernel = numba.njit(cache=True)(_approx_err_loop)
+
+    def _approx_err_numba(br_real):
+        return kernel(np.ascontiguousarray(br_real, dtype=float))
+    return _approx_err_numba
+
+
+def _approx_err(br_real):
+    # numba is imported on first use rather than with this module, so that
+    # importing libact doesn't pay for it unless AdaptiveActiveLearning runs
+    if _approx_err.impl is None:
+        _approx_err.impl = _load_approx_err_numba() or _approx_err_numpy
+    return _approx_err.impl(br_real)
+_approx_err.impl = None
 
-    err = neg + pos
-    return np.sum(err)
 
 class AdaptiveActiveLearning(QueryStrategy):
     r"""Adaptive Active Learning
@@ -35,7 +114,9 @@ class AdaptiveActiveLearning(QueryStrategy):
     Parameters
     ----------
     base_clf : ContinuousModel object instance
-        The base learner for binary relavance.
+        The base learner for binary relavance. If its scikit-learn estimator
+        has warm_start=True, the retraining for each candidate starts from
+        the model fitted on the labeled set.
 
     betas : list of float, 0 <= beta <= 1, default: [0., 0.1, ..., 0.9, 1.]
         List of trade-off parameter that balances the relative importance
@@ -81,7 +162,7 @@ class AdaptiveActiveLearning(QueryStrategy):
 
         self.n_labels = len(self.dataset.data[0][1])
 
-        self.base_clf = copy.deepcopy(base_clf)
+        self.base_clf = base_clf
 
         # TODO check beta value
         self.betas = betas
@@ -102,55 +183,58 @@ class AdaptiveActiveLearning(QueryStrategy):
         clf = BinaryRelevance(self.base_clf, n_jobs=self.n_jobs)
         clf.train(dataset)
         real = clf.predict_real(X_pool)
-        pred = clf.predict(X_pool)
+        # a positive decision value means the label is predicted as 1
+        pred = (real > 0).astype(int)
 
         # Separation Margin
-        pos = np.copy(real)
-        pos[real<=0] = np.inf
-        neg = np.copy(real)
-        neg[real>=0] = -np.inf
-        separation_margin = pos.min(axis=1) - neg.max(axis=1)
+        separation_margin = \
+            np.min(real, axis=1, where=real > 0, initial=np.inf) \
+            - np.max(real, axis=1, where=real < 0, initial=-np.inf)
         uncertainty = 1. / separation_margin
 
         # Label Cardinality Inconsistency
-        average_pos_lbl = Y.mean(axis=0).sum()
-        label_cardinality = np.sqrt((pred.sum(axis=1) - average_pos_lbl)**2)
-
-        candidate_idx_set = set()
-        for b in self.betas:
-            # score shape = (len(X_pool), )
-            score = uncertainty**b * label_cardinality**(1.-b)
-            for idx in np.where(score == np.max(score))[0]:
-                candidate_idx_set.add(idx)
-
-        candidates = list(candidate_idx_set)
-        approx_err = Parallel(n_jobs=self.n_jobs, backend='threading')(
-            delayed(_calc_approx_err)(
-                BinaryRelevance(self.base_clf),
-                Dataset(np.vstack((X, X_pool[idx])), np.vstack((Y, pred[idx]))),
-                X_pool)
-            for idx in candidates)
-
-        #approx_err = []
-        #for idx in candidates:
-        #    ds = Dataset(np.vstack((X, X_pool[idx])), np.vstack((Y, pred[idx])))
-        #    br = BinaryRelevance(self.base_clf)
-        #    br.train(ds)
-        #    br_real = br.predict_real(X_pool)
-
-        #    pos = np.copy(br_real)
-        #    pos[br_real<0] = 1
-        #    pos = np.max((1.-pos), axis=1)
-
-        #    neg = np.copy(br_real)
-        #    neg[br_real>0] = -1
-        #    neg = np.max((1.+neg), axis=1)
-
-        #    err = neg + pos
-
-        #    approx_err.append(np.sum(err))
-
-        choices = np.where(np.array(approx_err) == np.min(approx_err))[0]
+        average_pos_lbl = Y.sum() / float(Y.shape[0])
+        label_cardinality = np.abs(pred.sum(axis=1) - average_pos_lbl)
+
+        betas = np.asarray(self.betas)
+        # score shape = (len(X_pool), len(betas))
+        score = uncertainty[:, None]**betas * \
+            label_cardinality[:, None]**(1.-betas)
+        candidates = list(np.flatnonzero(
+            (score == score.max(axis=0)).any(axis=1)))
+        if clf.warm_start:
+            # start from the model fitted on the labeled set, which differs
+            # from each candidate's training set by a single sample
+            br = clf
+        else:
+            br = BinaryRelevance(self.base_clf)
+        if self.n_jobs == 1:
+            # the training sets of all candidates only differ in the last
+            # row, so reuse one dataset instead of stacking X and Y each time.
+            # This relies on Dataset.get_entries() returning its arrays by
+            # reference and on the labeled mask being recomputed per call.
+            ds = Dataset(np.vstack((X, X_pool[0])), np.vstack((Y, pred[0])))
+            X_aug, Y_aug = ds.get_entries()
+            approx_err = []
+            for idx in candidates:
+                X_aug[-1], Y_aug[-1] = X_pool[idx], pred[idx]
+                # candidates worse than the best one so far can't be chosen,
+                # so stop scoring them once they exceed it
+                approx_err.append(_calc_approx_err(
+                    br, ds, X_pool, bound=min(approx_err + [np.inf])))
+        else:
+            # each candidate retrains its own model, so the inner binary
+            # relevance is kept single-threaded to avoid oversubscription
+            approx_err = Parallel(n_jobs=self.n_jobs, backend='loky')(
+                delayed(_calc_approx_err)(
+                    br,
+                    Dataset(np.vstack((X, X_pool[idx])),
+                            np.vstack((Y, pred[idx]))),
+                    X_pool)
+                for idx in candidates)
+
+        approx_err = np.asarray(approx_err)
+        choices = np.flatnonzero(approx_err == approx_err.min())
         ask_idx = candidates[self.random_state_.choice(choices)]
 
         return unlabeled_entry_ids[ask_idx]
@@ -0,0 +1,82 @@
+""" Test Adaptive Active Learning helpers
+"""
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+from sklearn import datasets
+
+from libact.base.dataset import Dataset
+from libact.models import LogisticRegression
+from libact.models.multilabel import BinaryRelevance, DummyClf
+from libact.query_strategies.multilabel import AdaptiveActiveLearning
+from libact.query_strategies.multilabel import adaptive_active_learning
+from libact.query_strategies.multilabel.adaptive_active_learning import \
+    _approx_err_numpy, _calc_approx_err, _predict_real
+
+
+class AdaptiveActiveLearningTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.X, self.Y = datasets.make_multilabel_classification(
+            n_samples=100, n_classes=5, random_state=1126)
+        # one label all 0 and one all 1, handled by DummyClf
+        self.Y[:, 0] = 0
+        self.Y[:, 1] = 1
+
+    def test_predict_real(self):
+        br = BinaryRelevance(LogisticRegression(solver='liblinear'))
+        br.train(Dataset(self.X, self.Y))
+        self.assertIsInstance(br.clfs_[0], DummyClf)
+        self.assertIsInstance(br.clfs_[1], DummyClf)
+
+        assert_array_almost_equal(_predict_real(br, self.X),
+                                  br.predict_real(self.X))
+
+    def test_approx_err_numba(self):
+        approx_err_numba = adaptive_active_learning._load_approx_err_numba()
+        if approx_err_numba is None:
+            self.skipTest("numba not installed")
+        br_real = np.random.RandomState(1126).randn(50, 6) * 2
+        br_real[:, 2] = 0.
+        br_real[3] = [1.5, 2., 3., 1.1, 4., 2.5]
+        br_real[4] = [-1.5, -2., -3., -1.1, -4., -2.5]
+
+        err = _approx_err_numpy(br_real)
+        self.assertEqual(err[3], 0.)
+        assert_array_equal(approx_err_numba(br_real), err)
+
+    def test_calc_approx_err_bound(self):
+        br = BinaryRelevance(LogisticRegression(solver='liblinear'))
+        dataset = Dataset(self.X[:20], self.Y[:20])
+        X_pool = self.X[20:]
+        full = _calc_approx_err(br, dataset, X_pool, batch_size=7)
+        for bound in [0., full / 2., full - 1e-6, full, full + 1e-6, 2 * full]:
+            err = _calc_approx_err(br, dataset, X_pool, bound=bound,
+                                   batch_size=7)
+            self.assertEqual(err > bound, full > bound)
+            if full <= bound:
+                self.assertEqual(err, full)
+
+    def _run_qs(self, n_jobs):
+        y = np.empty(len(self.Y), dtype=object)
+        y[:] = [list(label) for label in self.Y[:10]] + [None] * 90
+        trn_ds = Dataset(self.X, y)
+        qs = AdaptiveActiveLearning(
+            trn_ds, base_clf=LogisticRegression(solver='liblinear'),
+            n_jobs=n_jobs, random_state=1126)
+        qseq = []
+        for _ in range(5):
+            ask_id = qs.make_query()
+            trn_ds.update(ask_id, list(self.Y[ask_id]))
+            qseq.append(ask_id)
+        return np.array(qseq)
+
+    def test_adaptive_active_learning_sequential(self):
+        # the sequential path reuses one dataset and stops scoring dominated
+        # candidates early, neither of which may change the queries
+        assert_array_equal(self._run_qs(n_jobs=1), self._run_qs(n_jobs=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -108,6 +108,14 @@ class MultilabelRealdataTestCase(unittest.TestCase):
         assert_array_equal(qseq,
                 np.array([594, 827, 1128, 419, 1223, 484, 96, 833, 37, 367]))
 
+    def test_adaptive_active_learning_sequential(self):
+        trn_ds = Dataset(self.X, self.y[:5] + [None] * (len(self.y) - 5))
+        qs = AdaptiveActiveLearning(trn_ds,
+                base_clf=LogisticRegression(solver='liblinear', multi_class="ovr"), n_jobs=1,
+                                            random_state=1126)
+        qseq = run_qs(trn_ds, qs, self.y, self.quota)
+        assert_array_equal(qseq,
+                np.array([594, 827, 1128, 419, 1223, 484, 96, 833, 37, 367]))
 
     def test_cost_sensitive_random_pair_encoding(self):
         trn_ds = Dataset(self.X, self.y[:5] + [None] * (len(self.y) - 5))